@@ -1,3 +0,0 @@
-from .aircraft import Aircraft
-
-__all__ = ['Aircraft']
\ No newline at end of file
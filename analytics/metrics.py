@@ -3,8 +3,20 @@ Analytics Module
 Post-simulation metrics and analysis
 """
 
-import pandas as pd
 import numpy as np
+from functools import cached_property
+
+from data.csv_io import read_csv
+from model.airport_model import MINUTE_COLUMNS
+
+
+AIRCRAFT_RESULT_TYPES = {
+    'arrival_time': 'int32',
+    'departure_time': 'int32',
+    'turnaround_time': 'int32',
+    'assigned_stand_type': 'category'
+}
+MINUTE_RESULT_TYPES = {column: 'int32' for column in MINUTE_COLUMNS}
 
 
 class SimulationMetrics:
@@ -35,6 +47,13 @@ class SimulationMetrics:
         }
         return metrics
     
+    @cached_property
+    def metrics(self):
+        """
+        All metrics, calculated once on first access and reused afterwards.
+        """
+        return self.calculate_all_metrics()
+    
     def plb_utilization(self):
         """
         Calculate PLB stand utilization percentage.
@@ -78,9 +97,10 @@ class SimulationMetrics:
         Returns:
             Dictionary with metric value and explanation
         """
-        total_aircraft = len(self.aircraft_df)
-        plb_aircraft = len(self.aircraft_df[self.aircraft_df['assigned_stand_type'] == 'PLB'])
-        assignment_rate_pct = (plb_aircraft / total_aircraft) * 100
+        plb_mask = (self.aircraft_df['assigned_stand_type'] == 'PLB').to_numpy()
+        total_aircraft = len(plb_mask)
+        plb_aircraft = int(plb_mask.sum())
+        assignment_rate_pct = plb_mask.mean() * 100
         
         return {
             'value': assignment_rate_pct,
@@ -109,8 +129,10 @@ class SimulationMetrics:
         Returns:
             Dictionary with metric value and explanation
         """
-        peak_parked = self.minute_df['total_parked'].max()
-        peak_time = self.minute_df['total_parked'].idxmax()
+        total_parked = self.minute_df['total_parked'].to_numpy()
+        peak_idx = int(total_parked.argmax())
+        peak_parked = int(total_parked[peak_idx])
+        peak_time = int(self.minute_df.index[peak_idx])
         
         return {
             'value': peak_parked,
@@ -137,10 +159,11 @@ class SimulationMetrics:
         Returns:
             Dictionary with metric value and explanation
         """
-        avg_ground_time = self.aircraft_df['turnaround_time'].mean()
-        std_ground_time = self.aircraft_df['turnaround_time'].std()
-        min_ground_time = self.aircraft_df['turnaround_time'].min()
-        max_ground_time = self.aircraft_df['turnaround_time'].max()
+        turnaround = self.aircraft_df['turnaround_time'].to_numpy()
+        avg_ground_time = turnaround.mean()
+        std_ground_time = turnaround.std(ddof=1)  # sample std, as pandas reports
+        min_ground_time = turnaround.min()
+        max_ground_time = turnaround.max()
         
         return {
             'value': avg_ground_time,
@@ -160,7 +183,7 @@ class SimulationMetrics:
         """
         Print a formatted summary of all metrics.
         """
-        metrics = self.calculate_all_metrics()
+        metrics = self.metrics
         
         print("\n" + "="*70)
         print("SIMULATION METRICS SUMMARY")
@@ -202,7 +225,7 @@ class SimulationMetrics:
         from pathlib import Path
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
-        metrics = self.calculate_all_metrics()
+        metrics = self.metrics
         
         with open(output_path, 'w') as f:
             f.write("="*70 + "\n")
@@ -217,20 +240,25 @@ class SimulationMetrics:
         print(f"\nMetrics exported to: {output_path}")
 
 
-def analyze_simulation(aircraft_csv='data/simulation_output.csv',
+def analyze_simulation(aircraft_df=None, minute_df=None,
+                       aircraft_csv='data/simulation_output.csv',
                        minute_csv='data/simulation_output_minute.csv'):
     """
     Load simulation results and perform analysis.
     
     Args:
+        aircraft_df: In-memory per-aircraft results; read from aircraft_csv if None
+        minute_df: In-memory minute-by-minute results; read from minute_csv if None
         aircraft_csv: Path to aircraft results CSV
         minute_csv: Path to minute-by-minute results CSV
     
     Returns:
         SimulationMetrics object
     """
-    aircraft_df = pd.read_csv(aircraft_csv)
-    minute_df = pd.read_csv(minute_csv)
+    if aircraft_df is None:
+        aircraft_df = read_csv(aircraft_csv, AIRCRAFT_RESULT_TYPES)
+    if minute_df is None:
+        minute_df = read_csv(minute_csv, MINUTE_RESULT_TYPES)
     
     metrics = SimulationMetrics(aircraft_df, minute_df)
     metrics.print_summary()
@@ -6,6 +6,9 @@ Generates synthetic aircraft arrival and turnaround data
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from scipy.stats import truncnorm
+
+from data.csv_io import write_csv
 
 
 def generate_aircraft_data(
@@ -39,13 +42,19 @@ def generate_aircraft_data(
     arrival_times = np.sort(arrival_times).astype(int)
     
 
+    # True truncated normal: clipping would pile samples up at the bounds
     std_dev = (max_turnaround - min_turnaround) / 6
-    turnaround_times = np.random.normal(mean_turnaround, std_dev, total_aircraft)
-    turnaround_times = np.clip(turnaround_times, min_turnaround, max_turnaround)
+    lower = (min_turnaround - mean_turnaround) / std_dev
+    upper = (max_turnaround - mean_turnaround) / std_dev
+    turnaround_times = truncnorm.rvs(
+        lower, upper, loc=mean_turnaround, scale=std_dev, size=total_aircraft
+    )
     turnaround_times = turnaround_times.astype(int)
     
+    aircraft_ids = np.char.mod('AC%04d', np.arange(total_aircraft))
+    
     aircraft_data = pd.DataFrame({
-        'aircraft_id': [f'AC{i:04d}' for i in range(total_aircraft)],
+        'aircraft_id': aircraft_ids,
         'arrival_time': arrival_times,
         'turnaround_time': turnaround_times
     })
@@ -64,7 +73,7 @@ def save_aircraft_data(output_path='data/input_aircraft.csv'):
     
     aircraft_data = generate_aircraft_data()
     
-    aircraft_data.to_csv(output_path, index=False)
+    write_csv(aircraft_data, output_path)
     
     print(f"Generated {len(aircraft_data)} aircraft records")
     print(f"Saved to: {output_path}")
@@ -1,3 +1,3 @@
-from .airport_model import AirportModel
+from .airport_model import AirportModel, run_scenarios
 
-__all__ = ['AirportModel']
\ No newline at end of file
+__all__ = ['AirportModel', 'run_scenarios']
\ No newline at end of file
@@ -1,14 +1,178 @@
-from mesa import Model
+import numpy as np
 import pandas as pd
 from collections import deque
-import heapq
-from agents.aircraft import Aircraft
+from data.csv_io import write_csv
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; kernels then run as plain Python
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+MINUTE_COLUMNS = ['current_time', 'plb_occupied', 'total_parked',
+                  'remote_occupied', 'plb_available']
+
+# Stand type codes; names are only materialised when writing results
+PLB = 0
+REMOTE = 1
+UNASSIGNED = -1
+STAND_TYPE_NAMES = np.array(['PLB', 'REMOTE'])
+
+# Aircraft state codes: scheduled -> parked -> departed
+SCHEDULED = 0
+PARKED = 1
+DEPARTED = 2
+
+
+@njit(cache=True)
+def _heap_push(heap, size, value):
+    """
+    Push value onto an array-backed min-heap holding size items.
+    """
+    heap[size] = value
+    child = size
+    while child > 0:
+        parent = (child - 1) // 2
+        if heap[parent] <= heap[child]:
+            break
+        heap[parent], heap[child] = heap[child], heap[parent]
+        child = parent
+
+
+@njit(cache=True)
+def _heap_pop(heap, size):
+    """
+    Drop the minimum of an array-backed min-heap holding size items.
+    """
+    size -= 1
+    heap[0] = heap[size]
+    parent = 0
+    while True:
+        child = 2 * parent + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[parent] <= heap[child]:
+            break
+        heap[parent], heap[child] = heap[child], heap[parent]
+        parent = child
+
+
+@njit(cache=True)
+def assign_stands(arrival, departure, plb_total, duration):
+    """
+    Greedy stand assignment over arrivals in order.
+    An aircraft gets a PLB if fewer than plb_total PLB aircraft are still
+    parked when it arrives, otherwise a Remote stand. Within a minute
+    arrivals are handled before departures, so a PLB freed at minute t
+    only becomes available to arrivals after t.
+    
+    Args:
+        arrival: Arrival times (minute), sorted ascending
+        departure: Departure times (minute), aligned with arrival
+        plb_total: Number of PLB stands
+        duration: Last simulated minute
+    
+    Returns:
+        int8 array of stand type codes (UNASSIGNED if never arrived)
+    """
+    stand_type = np.full(arrival.shape[0], UNASSIGNED, np.int8)
+    plb_departures = np.empty(max(plb_total, 1), np.int64)
+    plb_parked = 0
+    
+    for idx in range(arrival.shape[0]):
+        arrival_time = arrival[idx]
+        if arrival_time > duration:
+            break
+        
+        while plb_parked > 0 and plb_departures[0] < arrival_time:
+            _heap_pop(plb_departures, plb_parked)
+            plb_parked -= 1
+        
+        if plb_parked < plb_total:
+            stand_type[idx] = PLB
+            _heap_push(plb_departures, plb_parked, departure[idx])
+            plb_parked += 1
+        else:
+            stand_type[idx] = REMOTE
+    
+    return stand_type
+
+
+@njit(parallel=True, cache=True)
+def assign_stands_batch(arrival, departure, plb_values, durations):
+    """
+    Run assign_stands for independent scenarios in parallel.
+    
+    Args:
+        arrival: 2D arrival times, one sorted row per scenario (padded past duration)
+        departure: 2D departure times, aligned with arrival
+        plb_values: Number of PLB stands per scenario
+        durations: Last simulated minute per scenario
+    
+    Returns:
+        2D int8 array of stand type codes, one row per scenario
+    """
+    stand_types = np.empty(arrival.shape, np.int8)
+    for scenario in prange(arrival.shape[0]):
+        stand_types[scenario] = assign_stands(
+            arrival[scenario], departure[scenario], plb_values[scenario], durations[scenario]
+        )
+    return stand_types
+
+
+def run_scenarios(models):
+    """
+    Run several independent simulations, assigning stands for all of them
+    in one parallel kernel call.
+    
+    Args:
+        models: AirportModel instances, one per scenario (e.g. different
+            plb_stands values or input data seeds)
+    
+    Returns:
+        List of (minute_results, aircraft_results) tuples, one per model
+    """
+    if not models:
+        return []
+    
+    n_aircraft = max(len(model._arrival) for model in models)
+    
+    # Pad shorter scenarios with arrivals that never happen
+    padding = np.iinfo(np.int32).max
+    arrival = np.full((len(models), n_aircraft), padding, np.int32)
+    departure = np.full((len(models), n_aircraft), padding, np.int32)
+    for row, model in enumerate(models):
+        arrival[row, :len(model._arrival)] = model._arrival
+        departure[row, :len(model._departure)] = model._departure
+    
+    plb_values = np.array([model.plb_total for model in models], np.int64)
+    durations = np.array([model.simulation_duration for model in models], np.int64)
+    
+    stand_types = assign_stands_batch(arrival, departure, plb_values, durations)
+    
+    return [
+        model._finish_run(stand_types[row, :len(model._arrival)].copy())
+        for row, model in enumerate(models)
+    ]
 
 
-class AirportModel(Model):
+class AirportModel:
     """
     Event-driven airport stand allocation model.
     Uses greedy allocation strategy for PLB vs Remote stands.
+    
+    Aircraft state is held column-wise in NumPy arrays indexed by aircraft
+    position (sorted by arrival), rather than as one object per aircraft.
+    The run is a sweep-line over arrivals: only PLB occupancy needs a
+    stateful pass (a numba-compiled kernel when numba is installed),
+    everything else is derived with vectorized counting.
     """
     
     def __init__(self, aircraft_data, plb_stands=35, simulation_duration=360):
@@ -20,25 +184,18 @@ class AirportModel(Model):
             plb_stands: Number of available PLB stands
             simulation_duration: Total simulation time in minutes
         """
-        super().__init__()
-        
         #parameters
         self.plb_total = plb_stands
         self.plb_available = plb_stands
         self.simulation_duration = simulation_duration
         self.current_time = 0
         
+        self.remote_occupied = 0
+        self.total_parked = 0
         
-        self.event_queue = []
-        
-        self.parked_aircraft = set()
-        self.aircraft_by_id = {}
-        self.all_agents = []
-        
-        self.aircraft_results = []
+        self.aircraft_results = None
         self.minute_results = []
-        
-        self.model_reporters_data = []
+        self._minute_arr = None
         
         self._initialize_aircraft(aircraft_data)
         
@@ -46,119 +203,89 @@ class AirportModel(Model):
         print(f"  PLB Stands: {self.plb_total}")
         print(f"  Total Aircraft: {len(aircraft_data)}")
         print(f"  Simulation Duration: {self.simulation_duration} minutes")
-        print(f"  Total Events: {len(self.event_queue)}")
+        print(f"  Total Events: {len(self._arrival)}")
     
     def _initialize_aircraft(self, aircraft_data):
         """
-        Create aircraft agents and schedule ARRIVAL events.
+        Build per-aircraft state arrays, sorted into ARRIVAL order.
         
         Args:
             aircraft_data: DataFrame with aircraft information
         """
-        for idx, row in aircraft_data.iterrows():
-            aircraft = Aircraft(
-                unique_id=row['aircraft_id'],
-                model=self,
-                arrival_time=int(row['arrival_time']),
-                turnaround_time=int(row['turnaround_time'])
-            )
-            
-            self.all_agents.append(aircraft)
-            
-            self.aircraft_by_id[aircraft.aircraft_id] = aircraft
-            
-            self._schedule_event(aircraft.arrival_time, 'ARRIVAL', aircraft.aircraft_id)
-    
-    def _schedule_event(self, time, event_type, aircraft_id):
-        """
-        Schedule an event in the priority queue.
+        ids = aircraft_data['aircraft_id'].to_numpy()
+        arrival_times = aircraft_data['arrival_time'].to_numpy(np.int32)
+        turnaround_times = aircraft_data['turnaround_time'].to_numpy(np.int32)
         
-        Args:
-            time: Event time (minute)
-            event_type: 'ARRIVAL' or 'DEPARTURE'
-            aircraft_id: Aircraft identifier
-        """
-        heapq.heappush(self.event_queue, (time, event_type, aircraft_id))
+        # Same-minute arrivals are processed in aircraft_id order
+        order = np.lexsort((ids, arrival_times))
+        
+        self.aircraft_ids = ids[order]
+        self._arrival = arrival_times[order]
+        self._turnaround = turnaround_times[order]
+        self._departure = self._arrival + self._turnaround
+        self._stand_type = np.full(len(order), UNASSIGNED, np.int8)
+        self._state = np.full(len(order), SCHEDULED, np.int8)
+        self.parked_mask = np.zeros(len(order), bool)
     
-    def _process_arrival(self, aircraft_id):
+    def _occupancy_series(self, mask, out):
         """
-        Process an ARRIVAL event using greedy allocation.
+        Count aircraft on the ground at each minute.
         
         Args:
-            aircraft_id: Aircraft identifier
+            mask: Boolean array selecting which aircraft to count
+            out: Array receiving the number of selected aircraft parked at each minute
         """
-        aircraft = self.aircraft_by_id[aircraft_id]
+        minutes = self.simulation_duration + 1
+        arriving = self._arrival[mask & (self._state != SCHEDULED)]
+        departing = self._departure[mask & (self._state == DEPARTED)]
         
-        if self.plb_available > 0:
-            aircraft.assign_stand('PLB')
-            self.plb_available -= 1
-        else:
-            aircraft.assign_stand('REMOTE')
-        
-        self.parked_aircraft.add(aircraft_id)
-        
-
-
-
-
-
-        self._schedule_event(aircraft.departure_time, 'DEPARTURE', aircraft_id)
+        np.cumsum(
+            np.bincount(arriving, minlength=minutes)
+            - np.bincount(departing, minlength=minutes),
+            out=out
+        )
     
-    def _process_departure(self, aircraft_id):
+    def _build_minute_results(self):
         """
-        Process a DEPARTURE event.
+        Build the minute-by-minute system state table.
+        Each run gets its own buffer, so tables returned by earlier runs are
+        never overwritten.
         
-        Args:
-            aircraft_id: Aircraft identifier
+        Returns:
+            DataFrame with system state for minutes 0..simulation_duration
         """
-        aircraft = self.aircraft_by_id[aircraft_id]
-        
-        if aircraft.assigned_stand_type == 'PLB':
-            self.plb_available += 1
+        self._minute_arr = np.empty((self.simulation_duration + 1, len(MINUTE_COLUMNS)), np.int32)
+        current_time, plb_occupied, total_parked, remote_occupied, plb_available = self._minute_arr.T
         
-        aircraft.depart()
-        self.parked_aircraft.remove(aircraft_id)
+        current_time[:] = np.arange(self.simulation_duration + 1)
+        self._occupancy_series(np.ones(len(self._arrival), bool), out=total_parked)
+        self._occupancy_series(self._stand_type == PLB, out=plb_occupied)
+        np.subtract(total_parked, plb_occupied, out=remote_occupied)
+        np.subtract(self.plb_total, plb_occupied, out=plb_available)
         
-        self.aircraft_results.append({
-            'aircraft_id': aircraft.aircraft_id,
-            'arrival_time': aircraft.arrival_time,
-            'departure_time': aircraft.departure_time,
-            'turnaround_time': aircraft.turnaround_time,
-            'assigned_stand_type': aircraft.assigned_stand_type
-        })
-    
-    def _process_events_at_current_time(self):
-        """
-        Process all events scheduled for the current time.
-        """
-        while self.event_queue and self.event_queue[0][0] == self.current_time:
-            event_time, event_type, aircraft_id = heapq.heappop(self.event_queue)
-            
-            if event_type == 'ARRIVAL':
-                self._process_arrival(aircraft_id)
-            elif event_type == 'DEPARTURE':
-                self._process_departure(aircraft_id)
+        return pd.DataFrame(self._minute_arr, columns=MINUTE_COLUMNS, copy=False)
     
-    def step(self):
+    def _build_aircraft_results(self):
         """
-        Advance simulation by one minute.
-        Event-driven processing at each time step.
+        Collect departed aircraft into a results table in one pass.
+        Columns are sliced straight from the per-aircraft arrays; stand type
+        stays as int8 codes behind a categorical rather than per-row strings.
+        
+        Returns:
+            DataFrame with one row per departed aircraft, in departure order
         """
-
-        self._process_events_at_current_time()
+        departed = np.flatnonzero(self._state == DEPARTED)
+        departed = departed[np.lexsort((self.aircraft_ids[departed], self._departure[departed]))]
         
-
-        self.model_reporters_data.append({
-            'current_time': self.current_time,
-            'plb_occupied': self.plb_total - self.plb_available,
-            'total_parked': len(self.parked_aircraft),
-            'remote_occupied': len([a for a in self.parked_aircraft 
-                                   if self.aircraft_by_id[a].assigned_stand_type == 'REMOTE']),
-            'plb_available': self.plb_available
+        return pd.DataFrame({
+            'aircraft_id': self.aircraft_ids[departed],
+            'arrival_time': self._arrival[departed],
+            'departure_time': self._departure[departed],
+            'turnaround_time': self._turnaround[departed],
+            'assigned_stand_type': pd.Categorical.from_codes(
+                self._stand_type[departed], categories=STAND_TYPE_NAMES
+            )
         })
-        
-
-        self.current_time += 1
     
     def run_simulation(self):
         """
@@ -166,19 +293,46 @@ class AirportModel(Model):
         """
         print("\nRunning simulation...")
         
-        while self.current_time <= self.simulation_duration:
-            self.step()
-            
-
-            if self.current_time % 60 == 0:
-                print(f"  Time: {self.current_time // 60} hours ({self.current_time} minutes)")
+        stand_type = assign_stands(
+            self._arrival, self._departure, self.plb_total, self.simulation_duration
+        )
         
+        # Hour marks are reported once the sweep is done, in a single write
+        hour_marks = np.arange(60, self.simulation_duration + 1, 60).tolist()
+        if hour_marks:
+            print("\n".join(f"  Time: {minute // 60} hours ({minute} minutes)"
+                            for minute in hour_marks))
         print("Simulation complete!")
         
-
-        self.minute_results = pd.DataFrame(self.model_reporters_data)
+        return self._finish_run(stand_type)
+    
+    def _finish_run(self, stand_type):
+        """
+        Derive aircraft states and result tables from assigned stand types.
+        
+        Args:
+            stand_type: int8 stand type codes from assign_stands
+        
+        Returns:
+            Tuple of (minute_results, aircraft_results) DataFrames
+        """
+        self._stand_type = stand_type
+        
+        arrived = self._arrival <= self.simulation_duration
+        self._state[arrived] = PARKED
+        self._state[arrived & (self._departure <= self.simulation_duration)] = DEPARTED
+        
+        self.minute_results = self._build_minute_results()
+        self.aircraft_results = self._build_aircraft_results()
+        
+        # End-of-run counters are the last row of the minute table
+        self.current_time = self.simulation_duration
+        np.equal(self._state, PARKED, out=self.parked_mask)
+        self.total_parked = int(self._minute_arr[-1, MINUTE_COLUMNS.index('total_parked')])
+        self.remote_occupied = int(self._minute_arr[-1, MINUTE_COLUMNS.index('remote_occupied')])
+        self.plb_available = int(self._minute_arr[-1, MINUTE_COLUMNS.index('plb_available')])
         
-        return self.minute_results, pd.DataFrame(self.aircraft_results)
+        return self.minute_results, self.aircraft_results
     
     def save_results(self, output_path='data/simulation_output.csv'):
         """
@@ -187,11 +341,10 @@ class AirportModel(Model):
         Args:
             output_path: Path to save results
         """
-        aircraft_df = pd.DataFrame(self.aircraft_results)
-        aircraft_df.to_csv(output_path, index=False)
+        write_csv(self.aircraft_results, output_path)
         print(f"\nResults saved to: {output_path}")
         
 
         minute_output = output_path.replace('.csv', '_minute.csv')
-        self.minute_results.to_csv(minute_output, index=False)
+        write_csv(self.minute_results, minute_output)
         print(f"Minute-by-minute data saved to: {minute_output}")
\ No newline at end of file
@@ -13,7 +13,7 @@ import pandas as pd
 def run_complete_simulation():
     print("="*70)
     print("AIRPORT STAND ALLOCATION SIMULATION")
-    print("Event-Driven Greedy Allocation with Mesa")
+    print("Event-Driven Greedy Allocation")
     print("="*70)
     
     print("\nGenerating Aircraft Data...")
@@ -34,8 +34,8 @@ def run_complete_simulation():
     
     print("\nAnalyzing Metrics...")
     metrics = analyze_simulation(
-        aircraft_csv='data/simulation_output.csv',
-        minute_csv='data/simulation_output_minute.csv'
+        aircraft_df=aircraft_results_df,
+        minute_df=minute_df
     )
     
     print("\nSimulation Complete!")